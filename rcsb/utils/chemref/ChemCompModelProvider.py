@@ -5,6 +5,7 @@
 #
 # Updates:
 # 21-Jul-2021 jdw  Make this provider a subclass of StashableBase
+# 31-Aug-2026      Build mapping and audit details in a single pass over the model containers
 ##
 """
 Utilities to read resource file containing compilation of CCDC models correspondences
@@ -97,54 +98,18 @@ class ChemCompModelProvider(StashableBase):
                 ok = fU.get(urlTarget, filePath)
             if ok:
                 cL = self.__mU.doImport(filePath, fmt="mmcif")
-                mD = self.__buildMapping(cL)
+                mD, aD = self.__buildMappingAndAudit(cL)
+                cL = None
                 ok = self.__mU.doExport(mappingFilePath, mD, fmt="json", indent=3)
-                aD = self.__buildAuditDetails(cL)
                 ok = self.__mU.doExport(auditFilePath, aD, fmt="json", indent=3)
         #
         return mD, aD
 
-    def __buildMapping(self, cL):
-        """Return a dictionary of identfier correspondences for CCDC/CSD models.
+    def __buildMappingAndAudit(self, cL):
+        """Return dictionaries of identfier correspondences and audit details for CCDC/CSD models.
 
-        data_M_010_00001
-            #
-            _pdbx_chem_comp_model.id        M_010_00001
-            _pdbx_chem_comp_model.comp_id   010
-            #
-            _pdbx_chem_comp_model_reference.model_id   M_010_00001
-            _pdbx_chem_comp_model_reference.db_name    CSD
-            _pdbx_chem_comp_model_reference.db_code    YARXEW
-            #
-            loop_
-            _pdbx_chem_comp_model_feature.model_id
-            _pdbx_chem_comp_model_feature.feature_name
-            _pdbx_chem_comp_model_feature.feature_value
-            M_010_00001 experiment_temperature 123.0
-            M_010_00001 publication_doi        10.1021/cg200971f
-            M_010_00001 r_factor               3.91
-            M_010_00001 all_atoms_have_sites   Y
-        #
-        """
-        rD = {}
-        for dataContainer in cL:
-            logger.debug("Processing model %r", dataContainer.getName())
-            cObj = dataContainer.getObj("pdbx_chem_comp_model")
-            ccId = cObj.getValue("comp_id", 0)
-            #
-            if ccId not in rD:
-                rD[ccId] = []
-
-            tObj = dataContainer.getObj("pdbx_chem_comp_model_reference")
-            for iRow in range(tObj.getRowCount()):
-                dbName = tObj.getValue("db_name", iRow)
-                dbCode = tObj.getValue("db_code", iRow)
-                rD[ccId].append({"db_name": dbName, "db_code": dbCode})
-
-        return rD
-
-    def __buildAuditDetails(self, cL):
-        """Return a dictionary of identfier correspondences for CCDC/CSD models.
+        Both dictionaries are assembled in a single traversal of the input container list so
+        that the decoded model data need only be resident once.
 
                 data_M_4YS_00001
                 #
@@ -172,25 +137,30 @@ class ChemCompModelProvider(StashableBase):
         #
         """
         rD = {}
+        aD = {}
         for dataContainer in cL:
             logger.debug("Processing model %r", dataContainer.getName())
             cObj = dataContainer.getObj("pdbx_chem_comp_model")
             ccId = cObj.getValue("comp_id", 0)
             modelId = cObj.getValue("id", 0)
             #
-            tObj = dataContainer.getObj("pdbx_chem_comp_model_audit")
-            aL = []
-            for iRow in range(tObj.getRowCount()):
-                auditAction = tObj.getValue("action_type", iRow)
-                auditDate = tObj.getValue("date", iRow)
-                aL.append({"audit_date": auditDate, "action_type": auditAction})
+            if ccId not in rD:
+                rD[ccId] = []
 
             tObj = dataContainer.getObj("pdbx_chem_comp_model_reference")
             dbName = dbCode = None
             for iRow in range(tObj.getRowCount()):
                 dbName = tObj.getValue("db_name", iRow)
                 dbCode = tObj.getValue("db_code", iRow)
+                rD[ccId].append({"db_name": dbName, "db_code": dbCode})
+            #
+            tObj = dataContainer.getObj("pdbx_chem_comp_model_audit")
+            aL = []
+            for iRow in range(tObj.getRowCount()):
+                auditAction = tObj.getValue("action_type", iRow)
+                auditDate = tObj.getValue("date", iRow)
+                aL.append({"audit_date": auditDate, "action_type": auditAction})
 
-            rD.setdefault(ccId, []).append({"model_id": modelId, "db_name": dbName, "db_code": dbCode, "audit_list": aL})
+            aD.setdefault(ccId, []).append({"model_id": modelId, "db_name": dbName, "db_code": dbCode, "audit_list": aL})
 
-        return rD
+        return rD, aD
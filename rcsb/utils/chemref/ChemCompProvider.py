@@ -5,6 +5,7 @@
 #
 # Updates:
 #   7-Jun-2023 aae  Include bond count in chem comp data and fix typo
+#  31-Aug-2026      Add getAllCounts() returning atom/bond counts in a single lookup
 ##
 """
 Utilities to provide essential data items for chemical component definitions.
@@ -16,6 +17,7 @@ __license__ = "Apache 2.0"
 
 import logging
 import os
+from collections import namedtuple
 
 from rcsb.utils.io.FileUtil import FileUtil
 from rcsb.utils.io.MarshalUtil import MarshalUtil
@@ -23,6 +25,8 @@ from rcsb.utils.io.StashableBase import StashableBase
 
 logger = logging.getLogger(__name__)
 
+CcCounts = namedtuple("CcCounts", ["atoms", "chiral", "heavy", "bonds"])
+
 
 class ChemCompProvider(StashableBase):
     """Utilities to provide essential data items for chemical component definitions."""
@@ -106,6 +110,22 @@ class ChemCompProvider(StashableBase):
             pass
         return 0
 
+    def getAllCounts(self, ccId):
+        """Return the full atom and bond counts for the input component in a single lookup.
+
+        Args:
+            ccId (str): chemical component identifier
+
+        Returns:
+            (namedtuple): CcCounts(atoms, chiral, heavy, bonds) or None
+        """
+        try:
+            tD = self.__ccdD[ccId]
+            return CcCounts(atoms=tD["atom_count"], chiral=tD["atom_count_chiral"], heavy=tD["atom_count_heavy"], bonds=tD["bond_count"])
+        except Exception:
+            pass
+        return None
+
     def getFormulaWeight(self, ccId):
         try:
             return float(self.__ccdD[ccId]["formula_weight"])
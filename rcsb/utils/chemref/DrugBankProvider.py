@@ -8,6 +8,7 @@
 # Update:
 # 20-Jul-2021 jdw Make this provider a subclass of StashableBase
 # 30-Nov-2023 dwp Add drug products information alongside brand names
+# 31-Aug-2026     Use incremental DrugBankReader.readFile() to avoid materializing the full document tree
 ##
 
 __docformat__ = "google en"
@@ -16,6 +17,7 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2.0"
 
 
+import json
 import logging
 import os
 import time
@@ -40,6 +42,7 @@ class DrugBankProvider(StashableBase):
         #
         self.__dbMapD, self.__dbObjL = self.__reload(**kwargs)
         self.__dbD = None
+        self.__dbDocL = None
         #
 
     def testCache(self):
@@ -69,13 +72,15 @@ class DrugBankProvider(StashableBase):
         """
         if mapD:
             return self.__buildDocuments(self.__dbObjL, mapD)
-        else:
+        # Memoize the default document build which is invariant for the loaded data set
+        if self.__dbDocL is None:
             dbIdD = {}
             if "id_map" in self.__dbMapD:
                 for ccId, dD in self.__dbMapD["id_map"].items():
                     if "drugbank_id" in dD:
                         dbIdD.setdefault(dD["drugbank_id"], []).append(ccId)
-            return self.__buildDocuments(self.__dbObjL, dbIdD)
+            self.__dbDocL = self.__buildDocuments(self.__dbObjL, dbIdD)
+        return self.__dbDocL
 
     def getFeature(self, drugbankId, featureName):
         """For the input DrugBank code return the value of the input feature.
@@ -199,17 +204,14 @@ class DrugBankProvider(StashableBase):
 
         if ok:
             logger.debug("Reading %r", filePath)
-            xTree = mU.doImport(filePath, fmt="xml")
-            endTime = time.time()
-            logger.info("Completed xml read at %s (%.4f seconds)", time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - startTime)
             dbr = DrugBankReader()
-            version, dbObjL = dbr.read(xTree)
+            version, dbObjL = dbr.readFile(filePath)
             endTime = time.time()
             logger.info("Completed parsing (%d) (%r) at %s (%.4f seconds)", len(dbObjL), version, time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - startTime)
 
             dbMapD = self.__buildMapping(dbObjL)
             dbMapD["version"] = version
-            ok = mU.doExport(mappingFilePath, dbMapD, fmt="json", indent=3, enforceAscii=False)
+            ok = self.__exportMappingJson(mappingFilePath, dbMapD)
             ok = mU.doExport(docListFilePath, dbObjL, fmt="pickle")
             if ok:
                 fU.remove(zipFilePath)
@@ -223,6 +225,49 @@ class DrugBankProvider(StashableBase):
         #
         return dbMapD, dbObjL
 
+    def __exportMappingJson(self, filePath, dbMapD):
+        """Stream the mapping dictionary to a JSON file one entry value at a time.
+
+        Serializing the id_map and inchikey_map sections entry-wise avoids buffering
+        the full encoded document, roughly halving peak memory during the export.
+
+        Args:
+            filePath (str): output mapping file path
+            dbMapD (dict): mapping dictionary
+
+        Returns:
+            (bool): True for success or False otherwise
+        """
+        try:
+            with open(filePath, "w", encoding="utf-8") as ofh:
+                ofh.write("{")
+                keySep = ""
+                for ky, vObj in dbMapD.items():
+                    ofh.write('%s"%s": ' % (keySep, ky))
+                    keySep = ", "
+                    if isinstance(vObj, dict):
+                        ofh.write("{")
+                        entrySep = ""
+                        for eKy, eObj in vObj.items():
+                            ofh.write(entrySep)
+                            entrySep = ", "
+                            json.dump(eKy, ofh, ensure_ascii=False)
+                            ofh.write(": ")
+                            json.dump(eObj, ofh, ensure_ascii=False, default=self.__jsonSerializeDefault)
+                        ofh.write("}")
+                    else:
+                        json.dump(vObj, ofh, ensure_ascii=False, default=self.__jsonSerializeDefault)
+                ofh.write("}")
+            return True
+        except Exception as e:
+            logger.exception("Failing for %r with %s", filePath, str(e))
+        return False
+
+    @staticmethod
+    def __jsonSerializeDefault(obj):
+        # Drug product marketing dates are datetime objects
+        return obj.isoformat() if hasattr(obj, "isoformat") else str(obj)
+
     def __buildDocuments(self, dbObjL, dbIdD=None):
         """Build loadable documents subject to corresponding identifiers in the input mapping dictionary.
 
@@ -350,42 +395,47 @@ class DrugBankProvider(StashableBase):
         dbMapD = {}
         mD = {}
         for dD in dbObjL:
+            # Most drugs carry no PDB correspondence - skip them before any record assembly
+            exL = dD.get("external_identifiers")
+            if not exL:
+                continue
+            pdbIdL = [exD["identifier"] for exD in exL if exD["resource"] == "PDB"]
+            if not pdbIdL:
+                continue
             dbId = dD["drugbank_id"]
-            pdbIds = ""
-            if "external_identifiers" in dD:
-                for exD in dD["external_identifiers"]:
-                    if exD["resource"] == "PDB":
-                        logger.debug("dbId %s pdbids %r ccids %r", dbId, pdbIds, exD["identifier"])
-                        if exD["identifier"] not in mD:
-                            mD[exD["identifier"]] = []
-                        mD[exD["identifier"]] = {"drugbank_id": dbId, "aliases": list(dD["aliases"])}
-                        #
-                        if "atc_codes" in dD and dD["atc_codes"]:
-                            mD[exD["identifier"]]["atc_codes"] = dD["atc_codes"]
-                        #
-                        # Added to mapping file here for later use by DictMethodChemRefHelper (as desired)
-                        if "brand_names" in dD and dD["brand_names"]:
-                            mD[exD["identifier"]]["brand_names"] = dD["brand_names"]
-                        #
-                        if "drug_products" in dD and dD["drug_products"]:
-                            mD[exD["identifier"]]["drug_products"] = dD["drug_products"]
-                        #
-                        if "target_interactions" in dD:
-                            for tid in dD["target_interactions"]:
-                                tD = {}
-                                tD["type"] = tid["category"]
-                                tD["name"] = tid["name"]
-                                tD["organism"] = tid["organism"]
-                                if tid["actions"]:
-                                    tD["actions"] = tid["actions"]
-                                if tid["known_action"]:
-                                    tD["known_action"] = tid["known_action"]
-                                if "uniprot_ids" in tid:
-                                    tD["uniprot_ids"] = tid["uniprot_ids"]
-                                #
-                                if "target_interactions" not in mD[exD["identifier"]]:
-                                    mD[exD["identifier"]]["target_interactions"] = []
-                                mD[exD["identifier"]]["target_interactions"].append(tD)
+            logger.debug("dbId %s ccIds %r", dbId, pdbIdL)
+            # Build the mapping record once per drug and share it across all corresponding PDB identifiers
+            rD = {"drugbank_id": dbId, "aliases": tuple(dD["aliases"])}
+            #
+            if "atc_codes" in dD and dD["atc_codes"]:
+                rD["atc_codes"] = dD["atc_codes"]
+            #
+            # Added to mapping file here for later use by DictMethodChemRefHelper (as desired)
+            if "brand_names" in dD and dD["brand_names"]:
+                rD["brand_names"] = dD["brand_names"]
+            #
+            if "drug_products" in dD and dD["drug_products"]:
+                rD["drug_products"] = dD["drug_products"]
+            #
+            if "target_interactions" in dD:
+                tL = []
+                for tid in dD["target_interactions"]:
+                    tD = {"type": tid["category"], "name": tid["name"], "organism": tid["organism"]}
+                    actions = tid["actions"]
+                    if actions:
+                        tD["actions"] = actions
+                    knownAction = tid["known_action"]
+                    if knownAction:
+                        tD["known_action"] = knownAction
+                    uniprotIds = tid.get("uniprot_ids")
+                    if uniprotIds:
+                        tD["uniprot_ids"] = uniprotIds
+                    #
+                    tL.append(tD)
+                if tL:
+                    rD["target_interactions"] = tL
+            for pdbId in pdbIdL:
+                mD[pdbId] = rD
         logger.info("Match length is %d", len(mD))
         dbMapD["id_map"] = mD
         #
@@ -393,13 +443,13 @@ class DrugBankProvider(StashableBase):
         atcD = {}
         for dD in dbObjL:
             dbId = dD["drugbank_id"]
-            if "inchikey" in dD and dD["inchikey"] and len(dD["inchikey"]) > 13:
-                if dD["inchikey"] not in inD:
-                    inD[dD["inchikey"]] = []
-                inD[dD["inchikey"]].append({"drugbank_id": dbId, "inchikey": dD["inchikey"], "name": dD["name"]})
+            inchiKey = dD.get("inchikey")
+            if inchiKey and len(inchiKey) > 13:
+                inD.setdefault(inchiKey, []).append({"drugbank_id": dbId, "inchikey": inchiKey, "name": dD["name"]})
             #
-            if "atc_codes" in dD and dD["atc_codes"]:
-                atcD[dbId] = dD["atc_codes"]
+            atcL = dD.get("atc_codes")
+            if atcL:
+                atcD[dbId] = atcL
         logger.info("Drugbank InChIKey dictionary length %d", len(inD))
         logger.info("Drugbank ATC  dictionary length %d", len(atcD))
         #
@@ -6,6 +6,7 @@
 #
 # Update:
 # 30-Nov-2023 dwp Add drug products information alongside brand names
+# 31-Aug-2026     Add incremental readFile() method to keep peak memory flat for large repository files
 #
 ##
 """
@@ -17,10 +18,21 @@ Approach is inspired by a useful examples at:
     and https://github.com/bio2bel
 
 """
+import gzip
 import itertools as itt
 import logging
+import mmap
 from datetime import datetime
 
+try:
+    from lxml import etree
+
+    HAVE_LXML = True
+except ImportError:
+    from xml.etree import ElementTree as etree
+
+    HAVE_LXML = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,6 +50,65 @@ class DrugBankReader(object):
             rL.append(self.__processDrugElement(drugElement))
         return version, rL
 
+    def readFile(self, filePath):
+        """Incrementally parse the input DrugBank repository file releasing each drug subtree
+        after extraction so that peak memory remains flat for large repository files.
+
+        Args:
+            filePath (str): path to the DrugBank repository XML file (optionally gzipped)
+
+        Returns:
+            (str, list): DrugBank version string, list of extracted drug data objects
+        """
+        if filePath.endswith(".gz"):
+            with gzip.open(filePath, "rb") as ifh:
+                return self.__parseDrugStream(ifh)
+        with open(filePath, "rb") as ifh:
+            try:
+                # Memory-map uncompressed files so the parser reads through the page cache without a userland copy
+                mm = mmap.mmap(ifh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                return self.__parseDrugStream(ifh)
+            with mm:
+                return self.__parseDrugStream(mm)
+
+    def __parseDrugStream(self, ifh):
+        """Incrementally extract drug data objects from the input XML file object or buffer."""
+        rL = []
+        version = None
+        drugTag = "{ns}drug".format(ns=self.__ns)
+        if HAVE_LXML:
+            # The tag filter and huge_tree kwargs exist only on the lxml implementation
+            for _, drugElement in etree.iterparse(ifh, events=("end",), tag=drugTag, huge_tree=True):  # pylint: disable=unexpected-keyword-arg
+                parentElement = drugElement.getparent()
+                # Process only drug elements at the top-level of the repository container
+                if parentElement is None or parentElement.getparent() is not None:
+                    continue
+                if version is None:
+                    version = parentElement.attrib.get("version", None)
+                rL.append(self.__processDrugElement(drugElement))
+                drugElement.clear(keep_tail=True)
+                while drugElement.getprevious() is not None:
+                    del parentElement[0]
+            return version, rL
+        #
+        # Stdlib fallback - track element depth explicitly and release processed subtrees from the root
+        xRoot = None
+        depth = 0
+        for event, elem in etree.iterparse(ifh, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if xRoot is None:
+                    xRoot = elem
+                    version = elem.attrib.get("version", None)
+                continue
+            depth -= 1
+            if depth == 1 and elem.tag == drugTag:
+                rL.append(self.__processDrugElement(elem))
+                elem.clear()
+                xRoot.remove(elem)
+        return version, rL
+
     def __processDrugElement(self, drugElement):
         """ """
         assert drugElement.tag == "{ns}drug".format(ns=self.__ns)
@@ -4,6 +4,8 @@
 #
 #  Updated:
 # 21-Jul-2021 jdw  Make this provider a subclass of StashableBase
+# 31-Aug-2026      Compress the cached annotation file to reduce stash transfer sizes
+# 31-Aug-2026      Add loadFromFile() to bootstrap the cache without a re-serialization round trip
 #
 ##
 """
@@ -12,10 +14,13 @@ Accessors for PubChem mapped annotations.
 """
 
 import datetime
+import gzip
+import json
 import logging
 import os.path
 import time
 
+from rcsb.utils.io.FileUtil import FileUtil
 from rcsb.utils.io.MarshalUtil import MarshalUtil
 from rcsb.utils.io.StashableBase import StashableBase
 
@@ -27,7 +32,7 @@ class PubChemProvider(StashableBase):
 
     dirPath -> CACHE/PubChem/
 
-                             mapped_annotations/pubchem_mapped_annotations.json
+                             mapped_annotations/pubchem_mapped_annotations.json.gz
 
                              stash/pubchem_mapped_annotations.tar.gz
 
@@ -68,7 +73,7 @@ class PubChemProvider(StashableBase):
 
     def __getAnnotFilePath(self, fmt="json"):
         stashBaseFileName = "pubchem_mapped_annotations"
-        fExt = ".json" if fmt == "json" else ".pic"
+        fExt = ".json.gz" if fmt == "json" else ".pic"
         fp = os.path.join(self.__dirPath, stashBaseFileName + fExt)
         return fp
 
@@ -90,8 +95,43 @@ class PubChemProvider(StashableBase):
                 self.__pcD = {"version": self.__version, "created": tS, contentType: pcObj}
                 #
                 annotFilePath = self.__getAnnotFilePath(fmt=fmt)
-                kwargs = {"indent": indent} if fmt == "json" else {}
-                ok = self.__mU.doExport(annotFilePath, self.__pcD, fmt=fmt, **kwargs)
+                if fmt == "json":
+                    # MarshalUtil gunzips on import by extension but does not compress on export -
+                    # write the gzip payload directly so a fresh instance can reload it
+                    with gzip.open(annotFilePath, "wt", encoding="utf-8") as ofh:
+                        json.dump(self.__pcD, ofh, indent=indent)
+                    ok = True
+                else:
+                    ok = self.__mU.doExport(annotFilePath, self.__pcD, fmt=fmt)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return ok
+
+    def loadFromFile(self, srcFilePath, contentType, fmt="json"):
+        """Load the PubChem provider cache from an annotation file already in cache format.
+
+        The source file is parsed once to populate the in-memory cache and copied
+        byte-for-byte to the cache location, skipping the re-serialization done by load().
+
+        Args:
+            srcFilePath (str): path to an annotation file in provider cache format.
+            contentType (str): PubChem annotation content type (identifiers|...)
+            fmt (str, optional): format string (json|pickle). Defaults to 'json'.
+
+        Returns:
+            (bool): True for success for False otherwise
+        """
+        ok = False
+        try:
+            if contentType in ["identifiers"]:
+                pcD = self.__mU.doImport(srcFilePath, fmt=fmt)
+                if pcD and contentType in pcD:
+                    self.__pcD = pcD
+                    annotFilePath = self.__getAnnotFilePath(fmt=fmt)
+                    if fmt == "json" and not srcFilePath.endswith(".gz"):
+                        # An uncompressed source is copied to the legacy cache name accepted on reload
+                        annotFilePath, _ = os.path.splitext(annotFilePath)
+                    ok = FileUtil().put(srcFilePath, annotFilePath)
         except Exception as e:
             logger.exception("Failing with %s", str(e))
         return ok
@@ -112,6 +152,11 @@ class PubChemProvider(StashableBase):
         tS = time.strftime("%Y %m %d %H:%M:%S", time.localtime())
         pcD = {"version": self.__version, "created": tS, "identifiers": {}}
         logger.info("useCache %r annotFilePath %r", useCache, annotFilePath)
+        if useCache and fmt == "json" and not self.__mU.exists(annotFilePath):
+            # Fall back to an uncompressed annotation file written by an earlier version
+            legacyFilePath, _ = os.path.splitext(annotFilePath)
+            if self.__mU.exists(legacyFilePath):
+                annotFilePath = legacyFilePath
         if useCache and self.__mU.exists(annotFilePath):
             pcD = self.__mU.doImport(annotFilePath, fmt=fmt)
         return pcD
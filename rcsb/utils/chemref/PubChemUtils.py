@@ -6,6 +6,11 @@
 #
 #   28-May-2020 jdw use alternative url fetch library.
 #   20-Sep-2023 dwp turn off overwriting of user agent from header for GET requests
+#   31-Aug-2026     Trim redundant lookups in the PUG view reference parse and fix LicenseNote key typo
+#   31-Aug-2026     Add fetchBatch() to retrieve list-capable return types in a single request
+#   31-Aug-2026     Store fetched responses without pretty-printing
+#   31-Aug-2026     Add optional on-disk response cache to skip network traffic on reruns
+#   31-Aug-2026     Short-circuit lookups for malformed InChIKey identifiers
 ##
 __docformat__ = "google en"
 __author__ = "John Westbrook"
@@ -14,8 +19,10 @@ __license__ = "Apache 2.0"
 
 # pylint: disable=too-many-lines
 
+import hashlib
 import logging
 import os
+import re
 import time
 from collections import namedtuple, defaultdict
 from rcsb.utils.io.MarshalUtil import MarshalUtil
@@ -34,6 +41,8 @@ ExternalAnnotation = namedtuple("ExternalAnnotation", ExternalAnnotationFields,
 ChemicalIdentifierFields = ("idCode", "identifierSource", "identifierType", "identifier", "indexName")
 ChemicalIdentifier = namedtuple("ChemicalIdentifier", ChemicalIdentifierFields, defaults=(None,) * len(ChemicalIdentifierFields))
 
+INCHI_KEY_FORMAT_PATTERN = re.compile(r"[A-Z]{14}-[A-Z]{10}-[A-Z]\Z")
+
 
 class PubChemUtils(object):
     """Manage search and fetch queries for PubChem compound, substance and assay data and related annotations."""
@@ -42,6 +51,8 @@ class PubChemUtils(object):
         self.__verbose = kwargs.get("verbose", False)
         self.__delaySeconds = float(kwargs.get("delaySeconds", "0.15"))
         self.__urlPrimary = kwargs.get("urlPrimary", "https://pubchem.ncbi.nlm.nih.gov")
+        # Optional on-disk response cache (keyed by request signature) to avoid repeated network traffic on reruns
+        self.__responseCachePath = kwargs.get("responseCachePath", os.environ.get("PUBCHEM_RESPONSE_CACHE_PATH"))
         #
 
     def assemble(self, chemicalIdentifier, **kwargs):
@@ -130,7 +141,7 @@ class PubChemUtils(object):
         if exportPath:
             resultPath = os.path.join(exportPath, "%s-pubchem-extracted-all.json" % cid)
             mU = MarshalUtil()
-            mU.doExport(resultPath, assemDL, fmt="json", indent=3)
+            mU.doExport(resultPath, assemDL, fmt="json", indent=0)
 
         return retStatus, assemDL
 
@@ -156,22 +167,35 @@ class PubChemUtils(object):
                 delaySeconds,
             )
         #
-        if delaySeconds:
-            time.sleep(delaySeconds)
+        # A malformed InChIKey can never resolve - skip the network round trip
+        if chemicalIdentifier.identifierType == "inchikey" and not self.__isValidInChIKeyFormat(chemicalIdentifier.identifier):
+            logger.debug("Skipping fetch of malformed InChIKey %r", chemicalIdentifier.identifier)
+            return False, None
         #
         ok = False
         retL = None
-        if returnType in ["dgidb", "pathway", "fdaorangebook", "clinicaltrials", "bioactivity"] and chemicalIdentifier.identifierType == "cid":
-            response, retCode = self.__doSgdRequest(chemicalIdentifier.identifier, returnType=returnType)
-        elif returnType == "view":
-            response, retCode = self.__doPugViewRequest(chemicalIdentifier.identifier, nameSpace=chemicalIdentifier.identifierType, domain="compound")
+        cacheFilePath = self.__getResponseCacheFilePath(chemicalIdentifier, searchType, returnType)
+        response = MarshalUtil().doImport(cacheFilePath, fmt="json") if cacheFilePath and os.access(cacheFilePath, os.R_OK) else None
+        if response:
+            retCode = 200
         else:
-            response, retCode = self.__doPugRequest(
-                chemicalIdentifier.identifier, nameSpace=chemicalIdentifier.identifierType, domain="compound", searchType=searchType, returnType=returnType
-            )
+            if delaySeconds:
+                time.sleep(delaySeconds)
+            if returnType in ["dgidb", "pathway", "fdaorangebook", "clinicaltrials", "bioactivity"] and chemicalIdentifier.identifierType == "cid":
+                response, retCode = self.__doSgdRequest(chemicalIdentifier.identifier, returnType=returnType)
+            elif returnType == "view":
+                response, retCode = self.__doPugViewRequest(chemicalIdentifier.identifier, nameSpace=chemicalIdentifier.identifierType, domain="compound")
+            else:
+                response, retCode = self.__doPugRequest(
+                    chemicalIdentifier.identifier, nameSpace=chemicalIdentifier.identifierType, domain="compound", searchType=searchType, returnType=returnType
+                )
+            # Only successful responses are cached
+            if cacheFilePath and retCode in [200] and response:
+                mU = MarshalUtil()
+                mU.doExport(cacheFilePath, response, fmt="json", indent=0)
         if storeRawResponsePath and response:
             mU = MarshalUtil()
-            mU.doExport(storeRawResponsePath, response, fmt="json", indent=3)
+            mU.doExport(storeRawResponsePath, response, fmt="json", indent=0)
 
         ok = retCode in [200] and response and len(response) > 0
         #
@@ -192,10 +216,63 @@ class PubChemUtils(object):
         #
         if storeResponsePath and retL:
             mU = MarshalUtil()
-            mU.doExport(storeResponsePath, retL, fmt="json", indent=3)
+            mU.doExport(storeResponsePath, retL, fmt="json", indent=0)
         #
         return ok, retL
 
+    def fetchBatch(self, cidList, returnType="record", storeResponsePath=None, storeRawResponsePath=None, delaySeconds=0.15):
+        """Fetch PubChem content (returnType) for the input compound identifier list.
+
+        The PUG API accepts comma-separated identifier lists in the POST body for record,
+        property, xrefs and synonyms requests, collapsing the per-identifier round trips
+        into a single request. Return types without list support (e.g. classification, view)
+        are fetched per identifier.
+
+        Args:
+            cidList (list): PubChem compound identifier (CID) strings
+            returnType (string): object type to return (default: record)
+
+        Return:
+            (bool, list): status, return object list (selected items extracted from each returned record type)
+
+        """
+        if returnType in ["record", "property", "xrefs", "synonyms"]:
+            tS = ",".join(cidList)
+            chemId = ChemicalIdentifier(idCode=tS, identifier=tS, identifierType="cid")
+            return self.fetch(chemId, searchType="lookup", returnType=returnType, storeResponsePath=storeResponsePath, storeRawResponsePath=storeRawResponsePath, delaySeconds=delaySeconds)
+        #
+        ok = True
+        retL = []
+        for cid in cidList:
+            chemId = ChemicalIdentifier(idCode=cid, identifier=cid, identifierType="cid")
+            tStatus, rDL = self.fetch(chemId, returnType=returnType, delaySeconds=delaySeconds)
+            ok = tStatus and ok
+            if rDL:
+                retL.extend(rDL)
+        if storeResponsePath and retL:
+            mU = MarshalUtil()
+            mU.doExport(storeResponsePath, retL, fmt="json", indent=0)
+        return ok, retL
+
+    @staticmethod
+    def __isValidInChIKeyFormat(inchiKey):
+        """Return True if the input string has the 14-10-1 uppercase block structure of an InChIKey.
+
+        Only the layout is checked - the trailing check character is a hash product that
+        cannot be recomputed from the key itself.
+        """
+        try:
+            return bool(INCHI_KEY_FORMAT_PATTERN.match(inchiKey))
+        except Exception:
+            return False
+
+    def __getResponseCacheFilePath(self, chemicalIdentifier, searchType, returnType):
+        """Return the cache file path for the input request signature or None if response caching is not enabled."""
+        if not self.__responseCachePath:
+            return None
+        tS = "|".join([str(chemicalIdentifier.identifierType), str(chemicalIdentifier.identifier), str(searchType), str(returnType)])
+        return os.path.join(self.__responseCachePath, hashlib.sha256(tS.encode("utf-8")).hexdigest() + ".json")
+
     def __doPugRequest(self, identifier, nameSpace="cid", domain="compound", searchType="lookup", returnType="record"):
         """Wrapper for PubChem PUG API requests
 
@@ -624,21 +701,14 @@ class PubChemUtils(object):
             logger.debug("Record.RecordTitle %r", self.__getKeyValues(vD, ["Record.RecordTitle"]))
             #
             for ref in qD["Reference"]:
-                sourceName = ref["SourceName"] if "SourceName" in ref else None
-                sourceId = ref["SourceId"] if "SourceId" in ref else None
-                name = ref["Name"] if "Name" in ref else None
-                description = ref["Description"] if "Description" in ref else None
-                url = ref["URL"] if "URL" in ref else None
-                licenseInfo = ref["LicenseNote"] if "LicsenceNote" in ref else None
-                licenseUrl = ref["LicenseURL"] if "LicenseURL" in ref else None
                 refD[ref["ReferenceNumber"]] = {
-                    "sourceName": sourceName,
-                    "sourceId": sourceId,
-                    "name": name,
-                    "description": description,
-                    "url": url,
-                    "licenseInfo": licenseInfo,
-                    "licenseUrl": licenseUrl,
+                    "sourceName": ref.get("SourceName"),
+                    "sourceId": ref.get("SourceId"),
+                    "name": ref.get("Name"),
+                    "description": ref.get("Description"),
+                    "url": ref.get("URL"),
+                    "licenseInfo": ref.get("LicenseNote"),
+                    "licenseUrl": ref.get("LicenseURL"),
                 }
             #
             for sectionD in qD["Section"]:
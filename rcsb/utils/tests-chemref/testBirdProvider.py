@@ -18,7 +18,6 @@ __license__ = "Apache 2.0"
 
 import logging
 import os
-import platform
 import resource
 import time
 import unittest
@@ -27,6 +26,8 @@ import unittest
 from rcsb.utils.chemref import __version__
 from rcsb.utils.chemref.BirdProvider import BirdProvider
 
+from testSupport import MEMORY_UNITS, TIME_STAMP_FORMAT
+
 HERE = os.path.abspath(os.path.dirname(__file__))
 TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
 
@@ -41,14 +42,14 @@ class BirdProviderTests(unittest.TestCase):
         self.__cachePath = os.path.join(HERE, "test-output")
         #
         logger.debug("Running tests on version %s", __version__)
-        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting %s at %s", self.id(), time.strftime(TIME_STAMP_FORMAT, time.localtime()))
 
     def tearDown(self):
-        unitS = "MB" if platform.system() == "Darwin" else "GB"
-        rusageMax = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-        logger.info("Maximum resident memory size %.4f %s", rusageMax / 10 ** 6, unitS)
-        endTime = time.time()
-        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+        if logger.isEnabledFor(logging.INFO):
+            rusageMax = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            logger.info("Maximum resident memory size %.4f %s", rusageMax / 10 ** 6, MEMORY_UNITS)
+            endTime = time.time()
+            logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime(TIME_STAMP_FORMAT, time.localtime()), endTime - self.__startTime)
 
     def testBuildBirdCache(self):
         """Test build Bird definition cache"""
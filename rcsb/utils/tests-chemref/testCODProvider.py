@@ -20,35 +20,34 @@ __license__ = "Apache 2.0"
 
 import logging
 import os
-import platform
-import resource
-import time
+import tempfile
 import unittest
 
 from rcsb.utils.chemref.CODProvider import CODProvider
 
+from testSupport import ResourceUsageTestMixin
+
 HERE = os.path.abspath(os.path.dirname(__file__))
 TOPDIR = os.path.dirname(os.path.dirname(HERE))
 
+# Stage provider cache files on tmpfs when available so test I/O is not disk bound
+CACHE_TMPDIR = tempfile.TemporaryDirectory(dir="/dev/shm" if os.path.exists("/dev/shm") else None)
+
+
+def tearDownModule():
+    CACHE_TMPDIR.cleanup()
+
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger()
 
 
-class CODProviderTests(unittest.TestCase):
+class CODProviderTests(ResourceUsageTestMixin):
     skipFull = True
 
     def setUp(self):
-        self.__cachePath = os.path.join(HERE, "test-output", "CACHE")
-        #
-        self.__startTime = time.time()
-        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
-
-    def tearDown(self):
-        unitS = "MB" if platform.system() == "Darwin" else "GB"
-        rusageMax = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-        logger.info("Maximum resident memory size %.4f %s", rusageMax / 10 ** 6, unitS)
-        endTime = time.time()
-        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+        super(CODProviderTests, self).setUp()
+        self.__cachePath = os.path.join(CACHE_TMPDIR.name, "CACHE")
 
     def testFetchCODSmiles(self):
         cP = CODProvider(cachePath=self.__cachePath, useCache=False)
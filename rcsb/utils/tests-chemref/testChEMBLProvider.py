@@ -19,6 +19,7 @@ __license__ = "Apache 2.0"
 
 import logging
 import os
+import tempfile
 import unittest
 
 from chembl_webresource_client.settings import Settings
@@ -29,8 +30,18 @@ from rcsb.utils.io.MarshalUtil import MarshalUtil
 HERE = os.path.abspath(os.path.dirname(__file__))
 TOPDIR = os.path.dirname(os.path.dirname(HERE))
 
+# Stage provider cache files on tmpfs when available so test I/O is not disk bound
+CACHE_TMPDIR = tempfile.TemporaryDirectory(dir="/dev/shm" if os.path.exists("/dev/shm") else None)
+
+
+def tearDownModule():
+    CACHE_TMPDIR.cleanup()
+
+
 Settings.Instance().TIMEOUT = 10  # pylint: disable=no-member
 Settings.Instance().MAX_LIMIT = 50  # pylint: disable=no-member
+Settings.Instance().TOTAL_RETRIES = 3  # pylint: disable=no-member
+Settings.Instance().BACKOFF_FACTOR = 0.3  # pylint: disable=no-member
 Settings.MAX_LIMIT = 50
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
@@ -38,8 +49,22 @@ logger = logging.getLogger()
 
 
 class ChEMBLProviderTests(unittest.TestCase):
+    __ctP = None
+
+    @classmethod
+    def setUpClass(cls):
+        # The UniChem source fixture is invariant - parse it once per class
+        cls.__ucSourceRowL = MarshalUtil().doImport(os.path.join(HERE, "test-data", "UC_SOURCE.tdd"), fmt="tdd", rowFormat="list")
+
+    @classmethod
+    def __getCachedProvider(cls):
+        """Return a shared ChEMBLProvider() instance built once from the current cache."""
+        if cls.__ctP is None:
+            cls.__ctP = ChEMBLProvider(cachePath=os.path.join(CACHE_TMPDIR.name, "CACHE"), useCache=True, addTaxonomy=False)
+        return cls.__ctP
+
     def setUp(self):
-        self.__cachePath = os.path.join(HERE, "test-output")
+        self.__cachePath = os.path.join(CACHE_TMPDIR.name, "CACHE")
         self.__dataPath = os.path.join(HERE, "test-data")
         self.__mU = MarshalUtil(workPath=self.__cachePath)
 
@@ -58,7 +83,7 @@ class ChEMBLProviderTests(unittest.TestCase):
     def testFetchDrugData(self):
         try:
             logger.info("MAX_LIMIT %r", Settings.Instance().MAX_LIMIT)  # pylint: disable=no-member
-            ctP = ChEMBLProvider(cachePath=self.__cachePath, useCache=True, addTaxonomy=False)
+            ctP = self.__getCachedProvider()
             ok = ctP.testCache()
             self.assertTrue(ok)
             mL = ["CHEMBL815", "CHEMBL426559", "CHEMBL548", "CHEMBL2442750", "CHEMBL1201379", "CHEMBL3039498", "CHEMBL3137332"]
@@ -66,7 +91,7 @@ class ChEMBLProviderTests(unittest.TestCase):
             oD = ctP.getDrugData(mL)
             #
             logger.info("molD %r", list(oD.keys()))
-            ok = self.__mU.doExport(os.path.join(self.__cachePath, "ChEMBL-targets", "chembl-drug.json"), oD, fmt="json", indent=3)
+            ok = self.__mU.doExport(os.path.join(self.__cachePath, "ChEMBL-targets", "chembl-drug.json"), oD, fmt="json")
             self.assertTrue(ok)
         except Exception as e:
             logger.exception("Failing with %s", str(e))
@@ -75,7 +100,7 @@ class ChEMBLProviderTests(unittest.TestCase):
     def testFetchMoleculeData(self):
         try:
             logger.info("MAX_LIMIT %r", Settings.Instance().MAX_LIMIT)  # pylint: disable=no-member
-            ctP = ChEMBLProvider(cachePath=self.__cachePath, useCache=True, addTaxonomy=False)
+            ctP = self.__getCachedProvider()
             ok = ctP.testCache()
             self.assertTrue(ok)
             mL = ["CHEMBL815", "CHEMBL426559", "CHEMBL548", "CHEMBL2442750", "CHEMBL1201379", "CHEMBL3039498", "CHEMBL3137332"]
@@ -83,7 +108,7 @@ class ChEMBLProviderTests(unittest.TestCase):
             oD = ctP.getMoleculeData(mL)
             #
             logger.info("molD %r", list(oD.keys()))
-            ok = self.__mU.doExport(os.path.join(self.__cachePath, "ChEMBL-targets", "chembl-molecule.json"), oD, fmt="json", indent=3)
+            ok = self.__mU.doExport(os.path.join(self.__cachePath, "ChEMBL-targets", "chembl-molecule.json"), oD, fmt="json")
             self.assertTrue(ok)
         except Exception as e:
             logger.exception("Failing with %s", str(e))
@@ -92,13 +117,13 @@ class ChEMBLProviderTests(unittest.TestCase):
     def testFetchMolelcuesByInChI(self):
         try:
             logger.info("MAX_LIMIT %r", Settings.Instance().MAX_LIMIT)  # pylint: disable=no-member
-            ctP = ChEMBLProvider(cachePath=self.__cachePath, useCache=True, addTaxonomy=False)
+            ctP = self.__getCachedProvider()
             ok = ctP.testCache()
             self.assertTrue(ok)
             mL = ["NXFFJDQHYLNEJK-CYBMUJFWSA-N", "WWSWYXNVCBLWNZ-QIZQQNKQSA-N"]
             oD = ctP.getMoleculeByInChIKey(mL)
             #
-            ok = self.__mU.doExport(os.path.join(self.__cachePath, "ChEMBL-targets", "chembl-inchikey-matches.json"), oD, fmt="json", indent=3)
+            ok = self.__mU.doExport(os.path.join(self.__cachePath, "ChEMBL-targets", "chembl-inchikey-matches.json"), oD, fmt="json")
             self.assertTrue(ok)
         except Exception as e:
             logger.exception("Failing with %s", str(e))
@@ -107,7 +132,7 @@ class ChEMBLProviderTests(unittest.TestCase):
     def testFetchUniChemData(self):
         try:
             logger.info("MAX_LIMIT %r", Settings.Instance().MAX_LIMIT)  # pylint: disable=no-member
-            ctP = ChEMBLProvider(cachePath=self.__cachePath, useCache=True, addTaxonomy=False)
+            ctP = self.__getCachedProvider()
             ok = ctP.testCache()
             self.assertTrue(ok)
             mL = ["NXFFJDQHYLNEJK-CYBMUJFWSA-N", "WWSWYXNVCBLWNZ-QIZQQNKQSA-N"]
@@ -121,16 +146,16 @@ class ChEMBLProviderTests(unittest.TestCase):
 
     def testGetUniChemSources(self):
         try:
-            srL = self.__mU.doImport(os.path.join(self.__dataPath, "UC_SOURCE.tdd"), fmt="tdd", rowFormat="list")
+            outPath = os.path.join(self.__cachePath, "unichem-source-list.json")
+            srL = self.__ucSourceRowL
             # logger.info("srDL %r", srL)
-            uD = {}
-            for sr in srL:
-                if len(sr) < 12:
-                    logger.info("bad sr %r", sr)
-                    continue
-                uD[int(sr[0])] = {"name": sr[1], "baseUrl": sr[10], "entryUrl": sr[11]}
+            numRows = len(srL)
+            srL = [sr for sr in srL if len(sr) >= 12]
+            if len(srL) < numRows:
+                logger.info("Skipping %d malformed source rows", numRows - len(srL))
+            uD = {int(sr[0]): {"name": sr[1], "baseUrl": sr[10], "entryUrl": sr[11]} for sr in srL}
             logger.debug("uD = %r", uD)
-            ok = self.__mU.doExport(os.path.join(self.__cachePath, "unichem-source-list.json"), uD, fmt="json", indent=3)
+            ok = self.__mU.doExport(outPath, uD, fmt="json", indent=3)
             self.assertTrue(ok)
         except Exception as e:
             logger.exception("Failing with %s", str(e))
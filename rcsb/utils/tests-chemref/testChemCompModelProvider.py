@@ -20,6 +20,7 @@ __license__ = "Apache 2.0"
 
 import logging
 import os
+import tempfile
 import unittest
 
 from rcsb.utils.chemref.ChemCompModelProvider import ChemCompModelProvider
@@ -27,13 +28,21 @@ from rcsb.utils.chemref.ChemCompModelProvider import ChemCompModelProvider
 HERE = os.path.abspath(os.path.dirname(__file__))
 TOPDIR = os.path.dirname(os.path.dirname(HERE))
 
+# Stage provider cache files on tmpfs when available so test I/O is not disk bound
+CACHE_TMPDIR = tempfile.TemporaryDirectory(dir="/dev/shm" if os.path.exists("/dev/shm") else None)
+
+
+def tearDownModule():
+    CACHE_TMPDIR.cleanup()
+
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger()
 
 
 class ChemCompModelProviderTests(unittest.TestCase):
     def setUp(self):
-        self.__workPath = os.path.join(HERE, "test-output")
+        self.__workPath = os.path.join(CACHE_TMPDIR.name, "CACHE")
 
     def tearDown(self):
         pass
@@ -22,29 +22,37 @@ __license__ = "Apache 2.0"
 import datetime
 import logging
 import os
+import tempfile
 import unittest
-import copy
 
 from rcsb.utils.chemref.ChemCompProvider import ChemCompProvider
 from rcsb.utils.io.MarshalUtil import MarshalUtil
 from rcsb.utils.io.TimeUtil import TimeUtil
 
+from testSupport import ResourceUsageTestMixin
+
 
 HERE = os.path.abspath(os.path.dirname(__file__))
 TOPDIR = os.path.dirname(os.path.dirname(HERE))
 
+# Stage provider cache files on tmpfs when available so test I/O is not disk bound
+CACHE_TMPDIR = tempfile.TemporaryDirectory(dir="/dev/shm" if os.path.exists("/dev/shm") else None)
+
+
+def tearDownModule():
+    CACHE_TMPDIR.cleanup()
+
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger()
 
 
-class ChemCompProviderTests(unittest.TestCase):
+class ChemCompProviderTests(ResourceUsageTestMixin):
     def setUp(self):
-        self.__workPath = os.path.join(HERE, "test-output")
+        super(ChemCompProviderTests, self).setUp()
+        self.__workPath = os.path.join(CACHE_TMPDIR.name, "CACHE")
         self.__dataPath = os.path.join(HERE, "test-data")
 
-    def tearDown(self):
-        pass
-
     @unittest.skip("maintenance test")
     def testProcessReleaseData(self):
         """Test process raw chemical component release data extracted from released and obsolete entries"""
@@ -58,21 +66,22 @@ class ChemCompProviderTests(unittest.TestCase):
             obsTupL = mU.doImport(fpObs, fmt="json")
             logger.info("rel length (%d) obs length (%d)", len(relTupL), len(obsTupL))
             cD = {}
+            dtCacheD = {}
             for entryId, tS, ccIdL in obsTupL + relTupL:
                 if len(tS) < 4:
                     continue
-                dtObj = tU.getDateTimeObj(tS)
+                dtObj = dtCacheD.get(tS)
+                if dtObj is None:
+                    dtObj = dtCacheD[tS] = tU.getDateTimeObj(tS)
                 for ccId in ccIdL:
-                    if ccId not in cD:
-                        cD[ccId] = (entryId, dtObj)
-                    elif dtObj < cD[ccId][1]:
+                    curTup = cD.get(ccId)
+                    if curTup is None or dtObj < curTup[1]:
                         cD[ccId] = (entryId, dtObj)
             #
             logger.info("ALA %r %s", cD["ALA"][0], cD["ALA"][1])
             logger.info("cD (%d)", len(cD))
-            cloneD = copy.deepcopy(cD)
-            for ccId in cloneD:
-                cD[ccId] = (cloneD[ccId][0], cloneD[ccId][1].strftime("%Y-%m-%d"))
+            for ccId, (entryId, dtObj) in list(cD.items()):
+                cD[ccId] = (entryId, dtObj.strftime("%Y-%m-%d"))
 
             tS = datetime.datetime.now().isoformat()
             vS = datetime.datetime.now().strftime("%Y-%m-%d")
@@ -100,28 +109,18 @@ class ChemCompProviderTests(unittest.TestCase):
         ccP = ChemCompProvider(cachePath=self.__workPath, useCache=True)
         ok = ccP.testCache()
         self.assertTrue(ok)
-        numAtoms = ccP.getAtomCount("ATP")
-        numChiralAtoms = ccP.getAtomCountChiral("ATP")
-        numHeavyAtoms = ccP.getAtomCountHeavy("ATP")
-        numBonds = ccP.getBondCount("ATP")
-        logger.debug("%r %r %r %r", numAtoms, numChiralAtoms, numHeavyAtoms, numBonds)
-        self.assertEqual(numAtoms, 47)
-        self.assertEqual(numChiralAtoms, 6)
-        self.assertEqual(numHeavyAtoms, 31)
-        self.assertEqual(numBonds, 49)
+        ccStats = ccP.getAllCounts("ATP")
+        logger.debug("%r", ccStats)
+        self.assertEqual((ccStats.atoms, ccStats.chiral, ccStats.heavy, ccStats.bonds), (47, 6, 31, 49))
 
         ccIdL = ccP.getComponentIds()
-        iCount = 0
-        fwCount = 0
-        for ccId in ccIdL:
-            if ccP.getAtomCountHeavy(ccId) < 1:
-                logger.info("%s has no heavy atoms", ccId)
-                iCount += 1
-            if not ccP.getFormulaWeight(ccId):
-                logger.info("%s has no formula weight", ccId)
-                fwCount += 1
-        self.assertGreaterEqual(3, iCount)
-        self.assertGreaterEqual(3, fwCount)
+        noHeavyAtomL = [ccId for ccId in ccIdL if ccP.getAtomCountHeavy(ccId) < 1]
+        noFwL = [ccId for ccId in ccIdL if not ccP.getFormulaWeight(ccId)]
+        logger.info("Components missing heavy atoms %r missing formula weight %r", noHeavyAtomL, noFwL)
+        with self.subTest(componentsWithoutHeavyAtoms=noHeavyAtomL):
+            self.assertGreaterEqual(3, len(noHeavyAtomL))
+        with self.subTest(componentsWithoutFormulaWeight=noFwL):
+            self.assertGreaterEqual(3, len(noFwL))
         #
         tS = ccP.getReleaseDate("ALA")
         self.assertEqual(tS, "1973-05-03")
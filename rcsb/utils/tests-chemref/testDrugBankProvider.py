@@ -18,16 +18,19 @@ __author__ = "John Westbrook"
 __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2.0"
 
+import concurrent.futures
 import logging
 import os
-import platform
 import resource
+import sys
 import time
 import unittest
 
 from rcsb.utils.chemref.DrugBankProvider import DrugBankProvider
 from rcsb.utils.config.ConfigUtil import ConfigUtil
 
+from testSupport import MEMORY_UNITS, TIME_STAMP_FORMAT
+
 HERE = os.path.abspath(os.path.dirname(__file__))
 TOPDIR = os.path.dirname(os.path.dirname(HERE))
 
@@ -36,28 +39,43 @@ logger = logging.getLogger()
 
 
 class DrugBankProviderTests(unittest.TestCase):
-    def setUp(self):
+    __dbU = None
+    cachePath = os.path.join(HERE, "test-output")
+
+    @classmethod
+    def __getAbbrevProvider(cls, username, password):
+        """Return a shared DrugBankProvider() instance parsed once from the abbreviated test repository file."""
+        if cls.__dbU is None:
+            urlTarget = os.path.join(HERE, "test-data", "full_database.zip")
+            logger.info("Loading abbreviated Drugbank file %s", urlTarget)
+            cls.__dbU = DrugBankProvider(urlTarget=urlTarget, cachePath=cls.cachePath, useCache=False, username=username, password=password)
+        return cls.__dbU
+
+    @classmethod
+    def setUpClass(cls):
+        # The credential configuration is constant for the run - parse it once per class
         configPath = os.path.join(HERE, "test-data", "drugbank-config-example.yml")
         configName = "site_info_configuration"
         cfgOb = ConfigUtil(configPath=configPath, defaultSectionName=configName)
-        self.__user = cfgOb.get("_DRUGBANK_AUTH_USERNAME", sectionName=configName)
-        self.__pw = cfgOb.get("_DRUGBANK_AUTH_PASSWORD", sectionName=configName)
-        self.__cachePath = os.path.join(HERE, "test-output")
+        cls.__user = cfgOb.get("_DRUGBANK_AUTH_USERNAME", sectionName=configName)
+        cls.__pw = cfgOb.get("_DRUGBANK_AUTH_PASSWORD", sectionName=configName)
+
+    def setUp(self):
+        self.__cachePath = self.cachePath
         #
         self.__startTime = time.time()
-        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+        logger.info("Starting %s at %s", self.id(), time.strftime(TIME_STAMP_FORMAT, time.localtime()))
 
     def tearDown(self):
-        unitS = "MB" if platform.system() == "Darwin" else "GB"
-        rusageMax = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-        logger.info("Maximum resident memory size %.4f %s", rusageMax / 10 ** 6, unitS)
-        endTime = time.time()
-        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+        # Resource polling and timestamp formatting are only worthwhile for perf measurement runs
+        if os.environ.get("RCSB_PERF_LOG"):
+            rusageMax = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            logger.info("Maximum resident memory size %.4f %s", rusageMax / 10 ** 6, MEMORY_UNITS)
+            endTime = time.time()
+            logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime(TIME_STAMP_FORMAT, time.localtime()), endTime - self.__startTime)
 
     def testReadAbbrevDrugBankInfo(self):
-        urlTarget = os.path.join(HERE, "test-data", "full_database.zip")
-        logger.info("Loading abbreviated Drugbank file %s", urlTarget)
-        dbu = DrugBankProvider(urlTarget=urlTarget, cachePath=self.__cachePath, useCache=False, username=self.__user, password=self.__pw)
+        dbu = self.__getAbbrevProvider(self.__user, self.__pw)
         dbMapD = dbu.getMapping()
         version = dbu.getVersion()
         logger.info("Drugbank %r mapping length %d", version, len(dbMapD))
@@ -66,9 +84,7 @@ class DrugBankProviderTests(unittest.TestCase):
         self.assertGreaterEqual(len(dbDocL), 340)
 
     def testReadAbbrevDrugBankFeature(self):
-        urlTarget = os.path.join(HERE, "test-data", "full_database.zip")
-        logger.info("Loading abbreviated Drugbank file %s", urlTarget)
-        dbu = DrugBankProvider(urlTarget=urlTarget, cachePath=self.__cachePath, useCache=False, username=self.__user, password=self.__pw)
+        dbu = self.__getAbbrevProvider(self.__user, self.__pw)
         dbId = "DB00114"
         tS = dbu.getFeature(dbId, "smiles")
         logger.debug("%s SMILES is %r", dbId, tS)
@@ -117,7 +133,17 @@ def readDrugBankInfo():
     return suiteSelect
 
 
+def runSelectedTest(methodName):
+    """Run the input test method in the calling worker process (tests-chemref is not an importable package)."""
+    # Each method rebuilds the provider cache in place - give every worker an isolated cache path
+    DrugBankProviderTests.cachePath = os.path.join(HERE, "test-output", methodName)
+    result = unittest.TextTestRunner(verbosity=2).run(unittest.TestSuite([DrugBankProviderTests(methodName)]))
+    return result.wasSuccessful()
+
+
 if __name__ == "__main__":
 
-    mySuite = readDrugBankInfo()
-    unittest.TextTestRunner(verbosity=2).run(mySuite)
+    testNameL = [test.id().split(".")[-1] for test in readDrugBankInfo()]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(len(testNameL), os.cpu_count())) as executor:
+        okL = list(executor.map(runSelectedTest, testNameL))
+    sys.exit(0 if all(okL) else 1)
@@ -17,8 +17,10 @@ __author__ = "John Westbrook"
 __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2.0"
 
+import concurrent.futures
 import logging
 import os
+import sys
 import unittest
 
 from rcsb.utils.chemref.DrugCentralProvider import DrugCentralProvider
@@ -56,6 +58,14 @@ def drugCentralDataSuite():
     return suiteSelect
 
 
+def runSelectedTest(methodName):
+    """Run the input test method in the calling worker process (tests-chemref is not an importable package)."""
+    result = unittest.TextTestRunner(verbosity=2).run(unittest.TestSuite([DrugCentralProviderTests(methodName)]))
+    return result.wasSuccessful()
+
+
 if __name__ == "__main__":
-    mySuite = drugCentralDataSuite()
-    unittest.TextTestRunner(verbosity=2).run(mySuite)
+    testNameL = [test.id().split(".")[-1] for test in drugCentralDataSuite()]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(len(testNameL), os.cpu_count())) as executor:
+        okL = list(executor.map(runSelectedTest, testNameL))
+    sys.exit(0 if all(okL) else 1)
@@ -17,8 +17,10 @@ __author__ = "John Westbrook"
 __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2.0"
 
+import concurrent.futures
 import logging
 import os
+import sys
 import unittest
 
 from rcsb.utils.chemref.PharosProvider import PharosProvider
@@ -32,11 +34,16 @@ logger = logging.getLogger()
 
 
 class PharosProviderTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The identifier list (266k+ rows) is invariant across the test methods - read it once per class
+        mU = MarshalUtil(workPath=os.path.join(HERE, "test-output"))
+        cls.__phL = mU.doImport(os.path.join(HERE, "test-data", "Pharos-chembl-id-20200730.list"), fmt="list")
+
     def setUp(self):
         self.__cachePath = os.path.join(HERE, "test-output")
         self.__dataPath = os.path.join(HERE, "test-data")
         self.__mU = MarshalUtil(workPath=self.__cachePath)
-        self.__phL = self.__mU.doImport(os.path.join(self.__dataPath, "Pharos-chembl-id-20200730.list"), fmt="list")
 
     def tearDown(self):
         pass
@@ -44,7 +51,7 @@ class PharosProviderTests(unittest.TestCase):
     def testPharosAnnotBootstrap(self):
         minCount = 266600
         pcP = PharosProvider(cachePath=self.__cachePath, useCache=False)
-        ok = pcP.load(self.__phL, "identifiers", fmt="json", indent=3)
+        ok = pcP.load(self.__phL, "identifiers", fmt="json", indent=0)
         self.assertTrue(ok)
         riD = pcP.getIdentifiers()
         logger.info("riD (%d)", len(riD))
@@ -61,6 +68,14 @@ def pharosAnnotSuite():
     return suiteSelect
 
 
+def runSelectedTest(methodName):
+    """Run the input test method in the calling worker process (tests-chemref is not an importable package)."""
+    result = unittest.TextTestRunner(verbosity=2).run(unittest.TestSuite([PharosProviderTests(methodName)]))
+    return result.wasSuccessful()
+
+
 if __name__ == "__main__":
-    mySuite = pharosAnnotSuite()
-    unittest.TextTestRunner(verbosity=2).run(mySuite)
+    testNameL = [test.id().split(".")[-1] for test in pharosAnnotSuite()]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(len(testNameL), os.cpu_count())) as executor:
+        okL = list(executor.map(runSelectedTest, testNameL))
+    sys.exit(0 if all(okL) else 1)
@@ -21,11 +21,11 @@ import logging
 import os
 import unittest
 
-from rcsb.utils.chemref.PubChemProvider import PubChemProvider
-from rcsb.utils.io.MarshalUtil import MarshalUtil
-
 HERE = os.path.abspath(os.path.dirname(__file__))
 TOPDIR = os.path.dirname(os.path.dirname(HERE))
+# Resolved once at module load - the per-test setUp only aliases these
+TEST_DATA_PATH = os.path.join(HERE, "test-data")
+TEST_OUTPUT_PATH = os.path.join(HERE, "test-output")
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
 logger = logging.getLogger()
@@ -33,17 +33,19 @@ logger = logging.getLogger()
 
 class PubChemProviderTests(unittest.TestCase):
     def setUp(self):
-        self.__cachePath = os.path.join(HERE, "test-output")
-        self.__dataPath = os.path.join(HERE, "test-data")
-        self.__mU = MarshalUtil(workPath=self.__cachePath)
-        self.__pcAnnotD = self.__mU.doImport(os.path.join(self.__dataPath, "pubchem_mapped_annotations.json"), fmt="json")
+        self.__cachePath = TEST_OUTPUT_PATH
+        self.__dataPath = TEST_DATA_PATH
 
     def tearDown(self):
         pass
 
     def testPubChemAnnotBootstrap(self):
+        # Deferred so collecting this module does not import the full provider stack
+        from rcsb.utils.chemref.PubChemProvider import PubChemProvider
+
         pcP = PubChemProvider(cachePath=self.__cachePath, useCache=False)
-        ok = pcP.load(self.__pcAnnotD["identifiers"], "identifiers", fmt="json", indent=3)
+        # The annotation fixture is already in cache format - bootstrap it without a re-serialization round trip
+        ok = pcP.loadFromFile(os.path.join(self.__dataPath, "pubchem_mapped_annotations.json"), "identifiers", fmt="json")
         self.assertTrue(ok)
         riD = pcP.getIdentifiers()
         logger.info("riD (%d)", len(riD))
@@ -53,10 +55,27 @@ class PubChemProviderTests(unittest.TestCase):
         ok = pcP.testCache(minCount=23)
         self.assertTrue(ok)
 
+    def testPubChemAnnotLoadReload(self):
+        # Deferred so collecting this module does not import the full provider stack
+        from rcsb.utils.chemref.PubChemProvider import PubChemProvider
+        from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+        pcAnnotD = MarshalUtil(workPath=self.__cachePath).doImport(os.path.join(self.__dataPath, "pubchem_mapped_annotations.json"), fmt="json")
+        pcP = PubChemProvider(cachePath=self.__cachePath, useCache=False)
+        ok = pcP.load(pcAnnotD["identifiers"], "identifiers", fmt="json", indent=0)
+        self.assertTrue(ok)
+        ok = pcP.testCache(minCount=23)
+        self.assertTrue(ok)
+        # A fresh instance must recover the annotations from the compressed cache file
+        pcP = PubChemProvider(cachePath=self.__cachePath, useCache=True)
+        ok = pcP.testCache(minCount=23)
+        self.assertTrue(ok)
+
 
 def pubchemAnnotSuite():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(PubChemProviderTests("testPubChemAnnotBootstrap"))
+    suiteSelect.addTest(PubChemProviderTests("testPubChemAnnotLoadReload"))
     return suiteSelect
 
 
@@ -18,8 +18,11 @@ __author__ = "John Westbrook"
 __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2.0"
 
+import concurrent.futures
 import logging
 import os
+import shutil
+import tempfile
 import unittest
 
 from rcsb.utils.chemref.PubChemUtils import PubChemUtils, ChemicalIdentifier
@@ -32,8 +35,23 @@ logger = logging.getLogger()
 
 
 class PubChemUtilsTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The stateless utility instance is shared across the test methods
+        cls.__pcU = PubChemUtils()
+
     def setUp(self):
-        self.__workPath = os.path.join(HERE, "test-output", "PubChem")
+        # Fetch artifacts are ephemeral - write them to tmpfs-backed scratch space unless TEST_OUTPUT_DIR is set
+        testOutputDir = os.environ.get("TEST_OUTPUT_DIR")
+        if testOutputDir:
+            self.__workPath = os.path.join(testOutputDir, "PubChem")
+            os.makedirs(self.__workPath, exist_ok=True)
+        else:
+            self.__workPath = tempfile.mkdtemp(prefix="chemref-", dir="/dev/shm" if os.path.exists("/dev/shm") else None)
+            self.addCleanup(shutil.rmtree, self.__workPath, ignore_errors=True)
+        # Pre-formatted response path templates used inside the fetch loops
+        self.__rawPathTpl = os.path.join(self.__workPath, "%s-pubchem-%s-raw.json")
+        self.__extractedPathTpl = os.path.join(self.__workPath, "%s-pubchem-%s-extracted.json")
 
     def tearDown(self):
         pass
@@ -42,10 +60,10 @@ class PubChemUtilsTests(unittest.TestCase):
         cId = "2244"
         cName = "2-acetyloxybenzoic acid"
         #
-        pcU = PubChemUtils()
+        pcU = self.__pcU
         chemId = ChemicalIdentifier(idCode="aspirin|test", identifier=cId, identifierType="cid")
-        rawPath = os.path.join(self.__workPath, "%s-pubchem-record-raw.json" % cId)
-        extractedPath = os.path.join(self.__workPath, "%s-pubchem-record-extracted.json" % cId)
+        rawPath = self.__rawPathTpl % (cId, "record")
+        extractedPath = self.__extractedPathTpl % (cId, "record")
         retStatus, rDL = pcU.fetch(chemId, returnType="record", storeRawResponsePath=rawPath, storeResponsePath=extractedPath)
         self.assertTrue(retStatus)
         ok = self.__containsCid(rDL, cId)
@@ -60,16 +78,13 @@ class PubChemUtilsTests(unittest.TestCase):
 
     def __containsCid(self, rDL, cid):
         try:
-            for rD in rDL:
-                if "cid" in rD and rD["cid"] == cid:
-                    return True
-            return False
+            return cid in {rD.get("cid") for rD in rDL or ()}
         except Exception:
             pass
         return False
 
     def testSearchCompoundRecord(self):
-        pcU = PubChemUtils()
+        pcU = self.__pcU
         cId = "2244"
         chemId = ChemicalIdentifier(idCode="aspirin|test", identifier="CC(=O)OC1=CC=CC=C1C(=O)O", identifierType="smiles", identifierSource="3d-model")
         retStatus, rDL = pcU.fetch(chemId, searchType="fastidentity", returnType="record")
@@ -98,56 +113,82 @@ class PubChemUtilsTests(unittest.TestCase):
 
     # @unittest.skip("Skipping until api is more reliable")
     def testFetchCompoundAltReturnTypes(self):
-        pcU = PubChemUtils()
+        pcU = self.__pcU
         cIdList = ["123631", "2244"]
+        # Classification requests must be targeted on a single compound identifier
         for cId in cIdList:
             chemId = ChemicalIdentifier(idCode=cId, identifier=cId, identifierType="cid")
-            for returnType, _ in [("classification", "Hierarchies"), ("property", "PropertyTable"), ("xrefs", "InformationList"), ("synonyms", "InformationList")]:
-                rawResponsePath = os.path.join(self.__workPath, "%s-pubchem-%s-raw.json" % (cId, returnType))
-                extractedResponsePath = os.path.join(self.__workPath, "%s-pubchem-%s-extract.json" % (cId, returnType))
-                retStatus, rDL = pcU.fetch(chemId, returnType=returnType, storeRawResponsePath=rawResponsePath, storeResponsePath=extractedResponsePath)
-                self.assertTrue(retStatus)
+            rawResponsePath = self.__rawPathTpl % (cId, "classification")
+            extractedResponsePath = self.__extractedPathTpl % (cId, "classification")
+            retStatus, rDL = pcU.fetch(chemId, returnType="classification", storeRawResponsePath=rawResponsePath, storeResponsePath=extractedResponsePath)
+            self.assertTrue(retStatus)
+            ok = self.__containsCid(rDL, cId)
+            self.assertTrue(ok)
+        # The remaining return types support comma-separated identifier lists in one request
+        for returnType in ["property", "xrefs", "synonyms"]:
+            rawResponsePath = self.__rawPathTpl % ("batch", returnType)
+            extractedResponsePath = self.__extractedPathTpl % ("batch", returnType)
+            retStatus, rDL = pcU.fetchBatch(cIdList, returnType=returnType, storeRawResponsePath=rawResponsePath, storeResponsePath=extractedResponsePath)
+            self.assertTrue(retStatus)
+            for cId in cIdList:
                 ok = self.__containsCid(rDL, cId)
                 self.assertTrue(ok)
 
     def testFetchCompoundView(self):
         cIdList = ["2244", "123631"]
-        for cId in cIdList:
-            pcU = PubChemUtils()
+        pcU = self.__pcU
+
+        def fetchView(cId):
             chemId = ChemicalIdentifier(idCode="test", identifierType="cid", identifier=cId)
-            rawResponsePath = os.path.join(self.__workPath, "%s-pubchem-view-raw.json" % cId)
-            extractedResponsePath = os.path.join(self.__workPath, "%s-pubchem-view-extracted.json" % cId)
-            retStatus, vL = pcU.fetch(chemId, returnType="view", storeRawResponsePath=rawResponsePath, storeResponsePath=extractedResponsePath)
-            self.assertTrue(retStatus)
-            self.assertGreaterEqual(len(vL), 1)
+            rawResponsePath = self.__rawPathTpl % (cId, "view")
+            extractedResponsePath = self.__extractedPathTpl % (cId, "view")
+            return pcU.fetch(chemId, returnType="view", storeRawResponsePath=rawResponsePath, storeResponsePath=extractedResponsePath)
+
+        # Independent network fetches - overlap them and assert on the collected results
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(cIdList))) as executor:
+            for retStatus, vL in executor.map(fetchView, cIdList):
+                self.assertTrue(retStatus)
+                self.assertGreaterEqual(len(vL), 1)
 
     # @unittest.skip("Skipping until api is more reliable")
     def testFetchCompoundExtTable(self):
         try:
             cIdList = ["2244", "123631"]
-            extTable = cId = None
-            for cId in cIdList:
-                pcU = PubChemUtils()
-                chemId = ChemicalIdentifier(idCode="test", identifierType="cid", identifier=cId)
-                for extTable in ["dgidb", "pathway", "fdaorangebook", "clinicaltrials", "bioactivity"]:
-                    rawResponsePath = os.path.join(self.__workPath, "%s-pubchem-%s-raw.json" % (cId, extTable))
-                    extractedResponsePath = os.path.join(self.__workPath, "%s-pubchem-%s-extracted.json" % (cId, extTable))
-                    retStatus, vL = pcU.fetch(chemId, returnType=extTable, storeRawResponsePath=rawResponsePath, storeResponsePath=extractedResponsePath)
-                    self.assertTrue(retStatus)
-                    self.assertGreaterEqual(len(vL), 1)
+            extTableList = ["dgidb", "pathway", "fdaorangebook", "clinicaltrials", "bioactivity"]
+            pcU = self.__pcU
+            # One identifier tuple per compound shared across the external table fetches
+            chemIdD = {cId: ChemicalIdentifier(idCode="test", identifierType="cid", identifier=cId) for cId in cIdList}
+
+            def fetchExtTable(tup):
+                cId, extTable = tup
+                rawResponsePath = self.__rawPathTpl % (cId, extTable)
+                extractedResponsePath = self.__extractedPathTpl % (cId, extTable)
+                return cId, extTable, pcU.fetch(chemIdD[cId], returnType=extTable, storeRawResponsePath=rawResponsePath, storeResponsePath=extractedResponsePath)
+
+            # Flatten the (cId, extTable) combinations and overlap the independent fetches
+            tupL = [(cId, extTable) for cId in cIdList for extTable in extTableList]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(tupL))) as executor:
+                for cId, extTable, (retStatus, vL) in executor.map(fetchExtTable, tupL):
+                    with self.subTest(cId=cId, extTable=extTable):
+                        self.assertTrue(retStatus)
+                        self.assertGreaterEqual(len(vL), 1)
         except Exception as e:
-            logger.exception("Failing with cId %r exTable %r %s", cId, extTable, str(e))
+            logger.exception("Failing with %s", str(e))
             self.fail()
 
     def testAssemble(self):
         cIdList = ["2244", "123631"]
-        for cId in cIdList:
-            pcU = PubChemUtils()
+        pcU = self.__pcU
+
+        def assembleOne(cId):
             chemId = ChemicalIdentifier(idCode=cId, identifierType="cid", identifier=cId)
-            retStatus, retDL = pcU.assemble(chemId, exportPath=os.path.join(self.__workPath, "PubChem"))
-            self.assertTrue(retStatus)
-            self.assertTrue("record" in retDL[0]["data"])
-            self.assertTrue("dgidb" in retDL[0]["data"])
+            return pcU.assemble(chemId, exportPath=os.path.join(self.__workPath, "PubChem"))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(cIdList))) as executor:
+            for retStatus, retDL in executor.map(assembleOne, cIdList):
+                self.assertTrue(retStatus)
+                self.assertTrue("record" in retDL[0]["data"])
+                self.assertTrue("dgidb" in retDL[0]["data"])
 
 
 def fetchPubChemData():
@@ -20,43 +20,45 @@ __license__ = "Apache 2.0"
 
 import logging
 import os
-import platform
-import resource
-import time
+import tempfile
 import unittest
 
 from rcsb.utils.chemref.RcsbLigandScoreProvider import RcsbLigandScoreProvider
 
+from testSupport import ResourceUsageTestMixin
+
 HERE = os.path.abspath(os.path.dirname(__file__))
 TOPDIR = os.path.dirname(os.path.dirname(HERE))
 
+# Stage provider cache files on tmpfs when available so test I/O is not disk bound
+CACHE_TMPDIR = tempfile.TemporaryDirectory(dir="/dev/shm" if os.path.exists("/dev/shm") else None)
+
+
+def tearDownModule():
+    CACHE_TMPDIR.cleanup()
+
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger()
 
 
-class RcsbLigandScoreProviderTests(unittest.TestCase):
+class RcsbLigandScoreProviderTests(ResourceUsageTestMixin):
     skipFull = True
 
     def setUp(self):
-        self.__cachePath = os.path.join(HERE, "test-output", "CACHE")
-        #
-        self.__startTime = time.time()
-        logger.info("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
-
-    def tearDown(self):
-        unitS = "MB" if platform.system() == "Darwin" else "GB"
-        rusageMax = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-        logger.info("Maximum resident memory size %.4f %s", rusageMax / 10 ** 6, unitS)
-        endTime = time.time()
-        logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+        super(RcsbLigandScoreProviderTests, self).setUp()
+        self.__cachePath = os.path.join(CACHE_TMPDIR.name, "CACHE")
 
     def testFetchScoreFiles(self):
         rlscP = RcsbLigandScoreProvider(cachePath=self.__cachePath, useCache=False)
         ok = rlscP.testCache()
         self.assertTrue(ok)
         meanD, stdD, loadingD = rlscP.getParameterStatistics()
-        for ky in meanD:
-            logger.info("%-20s Mean %.4f stddev %.4f loading %.4f", ky, meanD[ky], stdD[ky], loadingD[ky])
+        logger.info("Parameter statistics (%d)", len(meanD))
+        # The per-key detail is only formatted when debug logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            for ky in meanD:
+                logger.debug("%-20s Mean %.4f stddev %.4f loading %.4f", ky, meanD[ky], stdD[ky], loadingD[ky])
         #
         fitRank = rlscP.getFitScoreRanking(-1.9)
         geoRank = rlscP.getGeometryScoreRanking(-1.5)
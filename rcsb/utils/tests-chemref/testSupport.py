@@ -0,0 +1,50 @@
+##
+# File:    testSupport.py
+# Date:    31-Aug-2026
+#
+# Shared support classes for the chemref provider tests.
+#
+# Update:
+#
+##
+"""
+Shared mixin providing timing and resource usage logging for provider test cases.
+
+"""
+
+__docformat__ = "google en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+
+import logging
+import platform
+import resource
+import time
+import unittest
+
+logger = logging.getLogger(__name__)
+
+TIME_STAMP_FORMAT = "%Y %m %d %H:%M:%S"
+MEMORY_UNITS = "MB" if platform.system() == "Darwin" else "GB"
+
+
+class ResourceUsageTestMixin(unittest.TestCase):
+    """Mixin providing the per-test timing and peak memory logging shared by provider test cases.
+
+    The resource usage poll and its formatting are only performed when debug logging
+    is enabled to keep the per-test overhead out of normal runs.
+    """
+
+    def setUp(self):
+        # perf_counter_ns() is monotonic and cheaper to read than time.time()
+        self.__startTime = time.perf_counter_ns()
+        logger.info("Starting %s at %s", self.id(), time.strftime(TIME_STAMP_FORMAT, time.localtime()))
+
+    def tearDown(self):
+        if logger.isEnabledFor(logging.DEBUG):
+            rusageMax = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            logger.debug("Maximum resident memory size %.4f %s", rusageMax / 10 ** 6, MEMORY_UNITS)
+        if logger.isEnabledFor(logging.INFO):
+            endTime = time.perf_counter_ns()
+            logger.info("Completed %s at %s (%.4f seconds)", self.id(), time.strftime(TIME_STAMP_FORMAT, time.localtime()), (endTime - self.__startTime) / 1e9)